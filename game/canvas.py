@@ -0,0 +1,286 @@
+"""
+Drawing Backends
+Small drawing interface used by UI and Menu, backed either by software
+blits onto a pygame Surface or by an SDL renderer with uploaded textures
+"""
+
+import os
+import weakref
+import pygame
+from .settings import *
+
+try:
+    from pygame._sdl2 import video
+except ImportError:
+    video = None
+
+
+def create_canvas(size, caption, backend=RENDER_BACKEND):
+    """Open the game window and return a canvas that draws onto it"""
+    if backend not in ("surface", "texture"):
+        raise ValueError(f"Unknown render backend: {backend}")
+
+    if backend == "texture":
+        if video is None:
+            print("⚠️ pygame._sdl2 is not available, using the surface backend")
+        else:
+            try:
+                return TextureCanvas.create_window(size, caption)
+            except pygame.error as e:
+                print(f"⚠️ Texture backend unavailable ({e}), using the surface backend")
+
+    screen = pygame.display.set_mode(size)
+    pygame.display.set_caption(caption)
+    return SurfaceCanvas(screen)
+
+
+class SurfaceCanvas:
+    """Software backend drawing straight onto a Surface"""
+
+    def __init__(self, surface):
+        self.surface = surface
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def get_width(self):
+        return self.surface.get_width()
+
+    def get_height(self):
+        return self.surface.get_height()
+
+    def fill(self, color):
+        self.surface.fill(color)
+
+    def draw_line(self, color, start, end):
+        pygame.draw.line(self.surface, color, start, end)
+
+    def draw_rect(self, color, rect, width=0, border_radius=0):
+        pygame.draw.rect(self.surface, color, rect, width, border_radius=border_radius)
+
+    def draw_circle(self, color, center, radius):
+        pygame.draw.circle(self.surface, color, center, radius)
+
+    def blit(self, image, dest):
+        """Draw a surface unscaled at a position or rect"""
+        self.surface.blit(image, dest)
+
+    def draw_image(self, image, center, size, alpha=255, angle=0):
+        """Draw a surface scaled to size, centered, with alpha and rotation"""
+        scaled = pygame.transform.scale(image, size)
+        if angle:
+            scaled = pygame.transform.rotate(scaled, angle)
+        if alpha < 255:
+            scaled.set_alpha(alpha)
+
+        self.surface.blit(scaled, scaled.get_rect(center=center))
+
+    def draw_layer(self, layer):
+        """Draw a CachedLayer"""
+        self.surface.blit(layer.surface, layer.rect)
+
+    def create_target(self, size, scale_filter="nearest"):
+        """Create an offscreen canvas that can be drawn back with draw_target"""
+        target = SurfaceCanvas(pygame.Surface(size).convert(self.surface))
+        target.scale_filter = scale_filter
+        return target
+
+    def draw_target(self, target):
+        """Stretch an offscreen canvas over this one"""
+        if target.scale_filter == "nearest":
+            pygame.transform.scale(target.surface, self.get_size(), self.surface)
+        else:
+            pygame.transform.smoothscale(target.surface, self.get_size(), self.surface)
+
+    def read_pixels(self, dest):
+        """Copy the current frame into an existing surface"""
+        dest.blit(self.surface, (0, 0))
+
+    def present(self):
+        pygame.display.flip()
+
+
+class TextureCache:
+    """Textures shared by every canvas of one renderer"""
+
+    def __init__(self):
+        self.surfaces = weakref.WeakKeyDictionary()
+        self.layers = weakref.WeakKeyDictionary()
+        self.shapes = {}
+        self.bound_target = None
+
+
+class TextureCanvas:
+    """Accelerated backend using pygame._sdl2 Renderer and Textures
+
+    Surfaces are uploaded once and cached for as long as they are alive,
+    so callers should keep pre-rendered surfaces rather than making new
+    ones every frame. Scaling, alpha and rotation are done by the renderer.
+    """
+
+    def __init__(self, renderer, size, target=None, cache=None):
+        self.renderer = renderer
+        self.size = size
+        self.target = target
+        self.cache = cache if cache is not None else TextureCache()
+        self.scale_filter = "nearest"
+
+    @classmethod
+    def create_window(cls, size, caption):
+        """Open a window with the best renderer SDL can give us
+
+        Hardware renderers are preferred; SDL falls back to its software
+        renderer, which can also be forced with SDL_RENDER_DRIVER=software.
+        """
+        window = video.Window(caption, size)
+        renderer = video.Renderer(window, accelerated=-1, target_texture=True)
+        canvas = cls(renderer, size)
+        canvas.window = window
+        return canvas
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def _bind(self):
+        """Make this canvas the render target"""
+        if self.cache.bound_target is not self.target:
+            self.renderer.target = self.target
+            self.cache.bound_target = self.target
+
+    def _texture(self, image):
+        """Get the texture for a surface, uploading it on first use"""
+        texture = self.cache.surfaces.get(image)
+        if texture is None:
+            texture = video.Texture.from_surface(self.renderer, image)
+            texture.blend_mode = pygame.BLENDMODE_BLEND
+            self.cache.surfaces[image] = texture
+        return texture
+
+    def _shape(self, key, size, draw):
+        """Get a white shape texture, tinted at draw time with color mod"""
+        texture = self.cache.shapes.get(key)
+        if texture is None:
+            shape = pygame.Surface(size, pygame.SRCALPHA)
+            draw(shape)
+            texture = video.Texture.from_surface(self.renderer, shape)
+            texture.blend_mode = pygame.BLENDMODE_BLEND
+            self.cache.shapes[key] = texture
+        return texture
+
+    def _draw_tinted(self, texture, color, rect):
+        texture.color = color[:3]
+        texture.alpha = color[3] if len(color) > 3 else 255
+        texture.draw(dstrect=rect)
+
+    def fill(self, color):
+        self._bind()
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.clear()
+
+    def draw_line(self, color, start, end):
+        self._bind()
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.draw_line(start, end)
+
+    def draw_rect(self, color, rect, width=0, border_radius=0):
+        self._bind()
+        rect = pygame.Rect(rect)
+
+        if border_radius:
+            # The renderer has no rounded rects, so cache them as shapes
+            texture = self._shape(
+                ("rect", rect.size, width, border_radius), rect.size,
+                lambda shape: pygame.draw.rect(
+                    shape, (255, 255, 255), shape.get_rect(), width,
+                    border_radius=border_radius
+                )
+            )
+            self._draw_tinted(texture, color, rect)
+            return
+
+        self.renderer.draw_color = pygame.Color(color)
+        if width == 0:
+            self.renderer.fill_rect(rect)
+        else:
+            for i in range(width):
+                self.renderer.draw_rect(rect.inflate(-2 * i, -2 * i))
+
+    def draw_circle(self, color, center, radius):
+        self._bind()
+        texture = self._shape(
+            ("circle", radius), (radius * 2, radius * 2),
+            lambda shape: pygame.draw.circle(shape, (255, 255, 255), (radius, radius), radius)
+        )
+        rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+        rect.center = center
+        self._draw_tinted(texture, color, rect)
+
+    def blit(self, image, dest):
+        """Draw a surface unscaled at a position or rect"""
+        self._bind()
+        texture = self._texture(image)
+        if isinstance(dest, pygame.Rect):
+            dest = dest.topleft
+        rect = pygame.Rect(dest, image.get_size())
+        texture.alpha = 255
+        texture.draw(dstrect=rect)
+
+    def draw_image(self, image, center, size, alpha=255, angle=0):
+        """Draw a surface scaled to size, centered, with alpha and rotation"""
+        self._bind()
+        texture = self._texture(image)
+        rect = pygame.Rect((0, 0), size)
+        rect.center = center
+        texture.alpha = alpha
+        texture.draw(dstrect=rect, angle=angle)
+
+    def draw_layer(self, layer):
+        """Draw a CachedLayer, re-uploading it only when it was redrawn"""
+        self._bind()
+        entry = self.cache.layers.get(layer)
+        if entry is None:
+            texture = video.Texture.from_surface(self.renderer, layer.surface)
+            texture.blend_mode = pygame.BLENDMODE_BLEND
+            entry = self.cache.layers[layer] = [layer.version, texture]
+        elif entry[0] != layer.version:
+            entry[1].update(layer.surface)
+            entry[0] = layer.version
+
+        entry[1].draw(dstrect=layer.rect)
+
+    def create_target(self, size, scale_filter="nearest"):
+        """Create an offscreen canvas that can be drawn back with draw_target"""
+        # SDL reads the scale quality hint when the texture is created
+        previous = os.environ.get("SDL_RENDER_SCALE_QUALITY")
+        os.environ["SDL_RENDER_SCALE_QUALITY"] = "nearest" if scale_filter == "nearest" else "linear"
+        try:
+            texture = video.Texture(self.renderer, size, target=True)
+        finally:
+            if previous is None:
+                del os.environ["SDL_RENDER_SCALE_QUALITY"]
+            else:
+                os.environ["SDL_RENDER_SCALE_QUALITY"] = previous
+
+        target = TextureCanvas(self.renderer, size, texture, self.cache)
+        target.scale_filter = scale_filter
+        return target
+
+    def draw_target(self, target):
+        """Stretch an offscreen canvas over this one"""
+        self._bind()
+        target.target.draw(dstrect=pygame.Rect((0, 0), self.size))
+
+    def read_pixels(self, dest):
+        """Copy the current frame into an existing surface, call before present"""
+        self._bind()
+        self.renderer.to_surface(dest)
+
+    def present(self):
+        self._bind()
+        self.renderer.present()
@@ -0,0 +1,142 @@
+"""
+Frame Capture
+Copies rendered frames into a shared memory buffer pool encoded by a worker process
+
+The pool is allocated once. The game thread reads each frame straight into
+a free buffer and queues its index; a worker process writes the buffer
+out as a PNG or as raw video and hands the index back. pygame holds the
+GIL while encoding PNGs, so encoding in a thread would still stall the
+game loop. When every buffer is busy the frame is dropped, never waited for.
+"""
+
+import multiprocessing
+import os
+import queue
+import signal
+import pygame
+from multiprocessing import shared_memory
+from .settings import CAPTURE_FORMAT, CAPTURE_POOL_SIZE, FPS
+
+CAPTURE_FORMATS = ("png", "raw")
+
+# Pool buffers are 32-bit R, G, B, padding (ffmpeg's rgb0)
+PIXEL_FORMAT = "RGBX"
+
+
+def _encode_frames(shm_name, size, fmt, directory, pending, free, written, failed):
+    """Worker loop: encode queued buffers until the None sentinel"""
+    # Ctrl+C reaches the whole process group; the game shuts the worker down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frame_bytes = size[0] * size[1] * 4
+    video = index = None
+    if fmt == "raw":
+        # Raw video has no gaps, so the index records which game frame each one is
+        video = open(os.path.join(directory, "capture.rgb0"), "wb")
+        index = open(os.path.join(directory, "capture.frames"), "w")
+    try:
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+
+            frame, slot = item
+            data = shm.buf[slot * frame_bytes:(slot + 1) * frame_bytes]
+            try:
+                if video is not None:
+                    video.write(data)
+                    index.write(f"{frame}\n")
+                else:
+                    # Named by game frame, so gaps show where frames were dropped
+                    image = pygame.image.frombuffer(data, size, PIXEL_FORMAT)
+                    pygame.image.save(image, os.path.join(directory, f"frame_{frame:06d}.png"))
+                    del image
+                written.value += 1
+            except (OSError, pygame.error) as e:
+                failed.value += 1
+                print(f"⚠️ Frame capture failed: {e}")
+            finally:
+                data.release()
+                free.put(slot)
+    finally:
+        if video is not None:
+            video.close()
+            index.close()
+        shm.close()
+
+
+class FrameCapture:
+    """Records every rendered frame to a PNG sequence or a raw video file"""
+
+    def __init__(self, directory, size, fmt=CAPTURE_FORMAT, pool_size=CAPTURE_POOL_SIZE):
+        if fmt not in CAPTURE_FORMATS:
+            raise ValueError(f"Unknown capture format: {fmt}")
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.size = size
+        self.format = fmt
+        self.frames = 0
+        self.dropped = 0
+
+        frame_bytes = size[0] * size[1] * 4
+        self.shm = shared_memory.SharedMemory(create=True, size=frame_bytes * pool_size)
+        self.views = [self.shm.buf[i * frame_bytes:(i + 1) * frame_bytes] for i in range(pool_size)]
+        self.buffers = [pygame.image.frombuffer(view, size, PIXEL_FORMAT) for view in self.views]
+
+        context = multiprocessing.get_context()
+        self.pending = context.Queue()
+        self.free = context.Queue()
+        for slot in range(pool_size):
+            self.free.put(slot)
+        self.written = context.Value("q", 0, lock=False)
+        self.failed = context.Value("q", 0, lock=False)
+
+        self.worker = context.Process(
+            target=_encode_frames,
+            args=(self.shm.name, size, fmt, directory, self.pending, self.free,
+                  self.written, self.failed),
+            daemon=True
+        )
+        self.worker.start()
+
+    def capture(self, canvas):
+        """Copy the current frame for encoding, never blocks"""
+        self.frames += 1
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+
+        canvas.read_pixels(self.buffers[slot])
+        self.pending.put((self.frames, slot))
+        return True
+
+    def close(self):
+        """Finish writing queued frames, free the pool and report"""
+        if self.worker is None:
+            return
+
+        self.pending.put(None)
+        self.worker.join()
+        self.worker = None
+
+        # Surfaces and views must let go of the block before it can close
+        self.buffers = []
+        for view in self.views:
+            view.release()
+        self.views = []
+        self.shm.close()
+        self.shm.unlink()
+
+        print(f"🎥 Captured {self.written.value} of {self.frames} frames to {self.directory} "
+              f"({self.dropped} dropped, {self.failed.value} failed)")
+        if self.format == "raw":
+            width, height = self.size
+            print(f"   Encode with: ffmpeg -f rawvideo -pixel_format rgb0 "
+                  f"-video_size {width}x{height} -framerate {FPS} "
+                  f"-i {os.path.join(self.directory, 'capture.rgb0')} capture.mp4")
+            if self.dropped or self.failed.value:
+                print("   Frames are missing, so that plays fast; "
+                      "capture.frames lists the game frame of each one")
@@ -8,22 +8,44 @@ import sys
 from .settings import *
 from .utils import load_game_state, save_game_state, load_plant_images
 from .plant import Plant
+from .history import PlantHistory
 from .ui import UI
 from .menu import Menu
+from .render_scale import RenderScaler
+from .canvas import create_canvas
+from .recording import InputRecorder
+from .capture import FrameCapture
 
 
 class GameManager:
-    def __init__(self):
+    def __init__(self, record_path=None, autosave=True, capture_path=None, capture_format=CAPTURE_FORMAT):
+        self.autosave = autosave
+        self.running = True
         self.setup_pygame()
         self.setup_game_objects()
         self.setup_game_state()
+        
+        # Optional input/timing recording for replays
+        self.recorder = None
+        if record_path:
+            self.recorder = InputRecorder(record_path, self.plant.get_state(), self.game_state)
+        
+        # Optional frame capture to PNGs or raw video
+        self.capture = None
+        if capture_path:
+            self.capture = FrameCapture(capture_path, self.canvas.get_size(), capture_format)
     
     def setup_pygame(self):
         """Initialize Pygame and create window"""
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("🌱 Virtual Plant Buddy - Enhanced Growth")
+        self.canvas = create_canvas(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), 
+            "🌱 Virtual Plant Buddy - Enhanced Growth"
+        )
         self.clock = pygame.time.Clock()
+        
+        # Performance mode renders the scene at a reduced internal resolution
+        self.render_scaler = RenderScaler(self.canvas) if PERFORMANCE_MODE else None
     
     def setup_game_objects(self):
         """Initialize game objects"""
@@ -32,8 +54,9 @@ class GameManager:
         
         # Create game objects
         self.plant = Plant(self.plant_images)
-        self.ui = UI(self.screen)
-        self.menu = Menu(self.screen)
+        self.ui = UI(self.canvas)
+        self.menu = Menu(self.canvas)
+        self.apply_render_scale()
     
     def setup_game_state(self):
         """Initialize game state"""
@@ -41,14 +64,24 @@ class GameManager:
         self.animation_time = 0
         self.water_effect_time = 0
         self.elapsed_time = 0
+        self.history = PlantHistory()
         
         # Load saved plant state
         saved_state = load_game_state()
         self.plant.load_state(saved_state)
     
-    def handle_events(self):
+    def apply_render_scale(self):
+        """Point the scene renderers at the current internal target"""
+        if self.render_scaler is None:
+            return
+        
+        target = self.render_scaler.target
+        self.ui.set_scene(target, self.render_scaler.scale)
+        self.menu.set_scene(target, self.render_scaler.scale)
+    
+    def handle_events(self, events):
         """Handle all game events"""
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 self.quit_game()
             
@@ -73,9 +106,14 @@ class GameManager:
             
             elif key == pygame.K_r:
                 self.plant.reset()
+                self.history.clear()
+            
+            elif key == pygame.K_h:
+                self.ui.cycle_history_window()
             
             elif key == pygame.K_ESCAPE:
-                save_game_state(self.plant.get_state())
+                if self.autosave:
+                    save_game_state(self.plant.get_state())
                 self.game_state = MENU
     
     def update(self, dt):
@@ -92,16 +130,22 @@ class GameManager:
             if self.elapsed_time >= 1:  # Update every second
                 self.elapsed_time = 0
                 self.plant.update(dt)
+                self.history.record(self.plant.state)
     
     def render(self):
         """Render the current game state"""
         if self.game_state == MENU:
-            self.menu.draw(self.animation_time)
+            self.menu.draw_scene(self.animation_time)
+            self.present_scene()
+            self.menu.draw_overlay(self.animation_time)
         
         elif self.game_state == PLAYING:
             self.render_game()
         
-        pygame.display.flip()
+        # The texture backend can only read the frame before presenting it
+        if self.capture:
+            self.capture.capture(self.canvas)
+        self.canvas.present()
     
     def render_game(self):
         """Render the main game"""
@@ -110,24 +154,50 @@ class GameManager:
         
         # Plant
         self.ui.draw_plant(self.plant, self.animation_time, self.water_effect_time)
+        self.present_scene()
         
         # UI elements
         self.ui.draw_stats_panel(self.plant)
         self.ui.draw_instructions()
         self.ui.draw_growth_indicator(self.plant)
+        self.ui.draw_history_graph(self.history)
+    
+    def present_scene(self):
+        """Upscale the scene to the window in performance mode"""
+        if self.render_scaler is not None:
+            self.render_scaler.present()
     
     def quit_game(self):
         """Clean shutdown"""
-        if self.game_state == PLAYING:
+        if self.game_state == PLAYING and self.autosave:
             save_game_state(self.plant.get_state())
-        pygame.quit()
-        sys.exit()
+        self.running = False
+    
+    def step(self, dt, events):
+        """Run a single frame"""
+        self.handle_events(events)
+        self.update(dt)
+        self.render()
     
     def run(self):
         """Main game loop"""
-        while True:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
-            
-            self.handle_events()
-            self.update(dt)
-            self.render()
\ No newline at end of file
+        try:
+            while self.running:
+                dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+                
+                if self.render_scaler and self.render_scaler.record_frame_time(self.clock.get_rawtime()):
+                    self.apply_render_scale()
+                
+                events = pygame.event.get()
+                if self.recorder:
+                    self.recorder.record_frame(dt, events)
+                
+                self.step(dt, events)
+        finally:
+            # Also on Ctrl+C or an error, so recordings and captures are complete
+            if self.recorder:
+                self.recorder.close(self.plant.get_state())
+            if self.capture:
+                self.capture.close()
+            pygame.quit()
+        sys.exit()
\ No newline at end of file
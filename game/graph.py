@@ -0,0 +1,101 @@
+"""
+History Graph Widget
+Sparkline of plant stat history that redraws incrementally
+"""
+
+import pygame
+from .settings import *
+from .layers import CachedLayer
+
+
+class HistoryGraph:
+    """Scrolling graph of one or more StatHistory series
+
+    The graph is kept in a cached layer. When new samples arrive, the
+    plot area is scrolled left and only the new columns are drawn, so
+    each frame costs the same no matter how much history there is.
+    """
+
+    def __init__(self, rect, series, tier=0, step=HISTORY_GRAPH_STEP):
+        self.layer = CachedLayer(rect)
+        self.series = series  # [(stat name, color), ...]
+        self.tier = tier
+        self.step = step
+
+        self.plot_rect = self.layer.surface.get_rect().inflate(-4, -4)
+        self.columns = self.plot_rect.width // step
+        self.drawn_total = None
+
+    def set_tier(self, tier):
+        """Switch the history tier shown, redrawn on the next draw"""
+        self.tier = tier
+        self.drawn_total = None
+
+    def window_seconds(self, history):
+        """Seconds of history the graph spans at the current tier"""
+        return self.columns * history.stats[self.series[0][0]].sample_span(self.tier)
+
+    def draw(self, canvas, history):
+        """Bring the graph up to date with history and draw it"""
+        total = history.stats[self.series[0][0]].total(self.tier)
+
+        if self.drawn_total is None or not 0 <= total - self.drawn_total < self.columns:
+            self._redraw(history)
+        elif total > self.drawn_total:
+            self._scroll(history, total - self.drawn_total)
+
+        self.drawn_total = total
+        canvas.draw_layer(self.layer)
+
+    def _value_y(self, value):
+        """Map a 0-100 stat value into the plot area"""
+        ratio = max(0.0, min(1.0, value / 100))
+        return self.plot_rect.bottom - 1 - int(ratio * (self.plot_rect.height - 1))
+
+    def _draw_columns(self, surface, history, count, first_column):
+        """Draw the latest count samples ending at the right edge"""
+        for name, color in self.series:
+            samples = history.stats[name].samples(count + 1, self.tier)
+            # The extra older sample connects the line to what is already drawn
+            previous = samples[0] if len(samples) > count else None
+            samples = samples[-count:] if count else []
+
+            x = self.plot_rect.right - 1 - (len(samples) - 1) * self.step
+            for low, high in samples:
+                if x >= first_column:
+                    y = self._value_y((low + high) / 2)
+                    if previous is not None:
+                        prev_y = self._value_y((previous[0] + previous[1]) / 2)
+                        pygame.draw.line(surface, color, (x - self.step, prev_y), (x, y))
+                    if high != low:
+                        pygame.draw.line(
+                            surface, color, (x, self._value_y(low)), (x, self._value_y(high))
+                        )
+                previous = (low, high)
+                x += self.step
+
+    def _redraw(self, history):
+        """Draw the whole graph from scratch"""
+        surface = self.layer.surface
+        surface.fill((0, 0, 0, 0))
+        pygame.draw.rect(surface, COLORS['panel_bg'], surface.get_rect())
+        pygame.draw.rect(surface, COLORS['panel_border'], surface.get_rect(), 2)
+
+        surface.set_clip(self.plot_rect)
+        self._draw_columns(surface, history, self.columns, self.plot_rect.left)
+        surface.set_clip(None)
+        self.layer.mark_changed()
+
+    def _scroll(self, history, new_samples):
+        """Shift the plot left and draw only the new samples"""
+        surface = self.layer.surface
+        shift = new_samples * self.step
+        first_column = self.plot_rect.right - shift
+
+        # Scrolling is limited to the clip area, so the border stays put
+        surface.set_clip(self.plot_rect)
+        surface.scroll(-shift, 0)
+        surface.fill(COLORS['panel_bg'], (first_column, self.plot_rect.top, shift, self.plot_rect.height))
+        self._draw_columns(surface, history, new_samples, first_column)
+        surface.set_clip(None)
+        self.layer.mark_changed()
@@ -0,0 +1,127 @@
+"""
+Stat History
+Fixed-memory time series of plant stats with downsampled min/max tiers
+"""
+
+from array import array
+from .settings import HISTORY_RAW_SAMPLES, HISTORY_TIERS
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of floats that overwrites the oldest values"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = array("f", [0.0]) * capacity
+        self.total = 0
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, value):
+        self.data[self.total % self.capacity] = value
+        self.total += 1
+
+    def latest(self, count):
+        """Up to count most recent values, oldest first"""
+        count = min(count, len(self))
+        end = self.total % self.capacity
+        start = end - count
+        if start >= 0:
+            return self.data[start:end].tolist()
+        return self.data[start:].tolist() + self.data[:end].tolist()
+
+    def clear(self):
+        self.total = 0
+
+
+class HistoryTier:
+    """Min/max of every `factor` samples from the level below"""
+
+    def __init__(self, factor, capacity):
+        self.factor = factor
+        self.mins = RingBuffer(capacity)
+        self.maxs = RingBuffer(capacity)
+        self.pending = None
+
+    def add(self, low, high):
+        """Merge a sample in, returns the finished (min, max) every factor samples"""
+        if self.pending is None:
+            self.pending = [low, high, 0]
+        pending = self.pending
+        pending[0] = min(pending[0], low)
+        pending[1] = max(pending[1], high)
+        pending[2] += 1
+
+        if pending[2] < self.factor:
+            return None
+
+        self.mins.append(pending[0])
+        self.maxs.append(pending[1])
+        self.pending = None
+        return pending[0], pending[1]
+
+    def clear(self):
+        self.mins.clear()
+        self.maxs.clear()
+        self.pending = None
+
+
+class StatHistory:
+    """History of one stat: raw samples plus coarser min/max tiers"""
+
+    def __init__(self, raw_samples=HISTORY_RAW_SAMPLES, tiers=HISTORY_TIERS):
+        self.raw = RingBuffer(raw_samples)
+        self.tiers = [HistoryTier(factor, capacity) for factor, capacity in tiers]
+
+    def record(self, value):
+        """Add a sample, O(1) amortized"""
+        self.raw.append(value)
+
+        low = high = value
+        for tier in self.tiers:
+            merged = tier.add(low, high)
+            if merged is None:
+                break
+            low, high = merged
+
+    def total(self, tier=0):
+        """Number of samples ever stored at a tier (0 is raw)"""
+        return self.raw.total if tier == 0 else self.tiers[tier - 1].mins.total
+
+    def sample_span(self, tier=0):
+        """Number of raw samples covered by one sample at a tier"""
+        span = 1
+        for level in self.tiers[:tier]:
+            span *= level.factor
+        return span
+
+    def samples(self, count, tier=0):
+        """Up to count most recent (min, max) pairs at a tier, oldest first"""
+        if tier == 0:
+            return [(value, value) for value in self.raw.latest(count)]
+        tier = self.tiers[tier - 1]
+        return list(zip(tier.mins.latest(count), tier.maxs.latest(count)))
+
+    def clear(self):
+        self.raw.clear()
+        for tier in self.tiers:
+            tier.clear()
+
+
+class PlantHistory:
+    """Water and happiness history of one plant"""
+
+    STATS = ("water", "happiness")
+
+    def __init__(self):
+        self.stats = {name: StatHistory() for name in self.STATS}
+
+    def record(self, state):
+        """Sample the plant state, call once per plant update"""
+        for name, history in self.stats.items():
+            history.record(state[name])
+
+    def clear(self):
+        for history in self.stats.values():
+            history.clear()
@@ -0,0 +1,36 @@
+"""
+Cached Render Layers
+Offscreen surfaces that are only redrawn when their contents change
+"""
+
+import pygame
+
+
+class CachedLayer:
+    def __init__(self, rect, alpha=True):
+        self.rect = pygame.Rect(rect)
+        flags = pygame.SRCALPHA if alpha else 0
+        self.surface = pygame.Surface(self.rect.size, flags)
+        self.key = None
+        self.dirty = True
+        self.version = 0
+
+    def update(self, key, render):
+        """Redraw the layer with render(surface) if the watched key changed"""
+        if not self.dirty and key == self.key:
+            return False
+
+        self.surface.fill((0, 0, 0, 0))
+        render(self.surface)
+        self.key = key
+        self.dirty = False
+        self.version += 1
+        return True
+
+    def mark_changed(self):
+        """Note that the surface was drawn on directly"""
+        self.version += 1
+
+    def draw(self, canvas):
+        """Draw the cached surface onto a canvas"""
+        canvas.draw_layer(self)
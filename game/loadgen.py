@@ -0,0 +1,118 @@
+"""
+Garden Load Generator
+Benchmarks throughput and latency of the garden server
+
+Usage:
+    python -m game.server &
+    python -m game.loadgen [--connections 50] [--requests 2000] [--pipeline 8]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from .settings import GARDEN_HOST, GARDEN_PORT
+from .utils import summarize_timings
+
+
+async def run_connection(host, port, requests, pipeline, plants, water_ratio, seed, latencies):
+    """Send requests over one connection with up to `pipeline` in flight"""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at = {}
+    in_flight = asyncio.Semaphore(pipeline)
+    errors = 0
+    closed = False
+
+    async def receive():
+        nonlocal errors, closed
+        answered = 0
+        try:
+            while answered < requests:
+                line = await reader.readline()
+                if not line:
+                    raise ConnectionError("server closed the connection")
+                response = json.loads(line)
+                if answered == 0 and response.get("error") == "too many connections":
+                    # The server turned the whole connection away
+                    break
+                answered += 1
+                if "id" in response:
+                    latencies.append(time.perf_counter() - sent_at.pop(response["id"]))
+                if not response.get("ok"):
+                    errors += 1
+                in_flight.release()
+        except ConnectionError:
+            pass
+
+        # Requests that never got a reply failed with the connection
+        errors += requests - answered
+        closed = True
+        for _ in range(pipeline):
+            in_flight.release()
+
+    receiver = asyncio.create_task(receive())
+    for request_id in range(requests):
+        await in_flight.acquire()
+        if closed:
+            break
+        cmd = "water" if rng.random() < water_ratio else "query"
+        request = {"id": request_id, "cmd": cmd, "plant": f"plant-{rng.randrange(plants)}"}
+        sent_at[request_id] = time.perf_counter()
+        try:
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            # The receiver reports why the server closed the connection
+            break
+
+    await receiver
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except ConnectionError:
+        # The server already dropped the connection
+        pass
+    return errors
+
+
+async def run_load(host, port, connections, requests, pipeline, plants, water_ratio, seed):
+    """Run all connections concurrently and return (elapsed, latencies, errors)"""
+    latencies = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(
+        run_connection(host, port, requests, pipeline, plants, water_ratio, seed + i, latencies)
+        for i in range(connections)
+    ))
+    return time.perf_counter() - start, latencies, sum(errors)
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Garden server load generator")
+    parser.add_argument("--host", default=GARDEN_HOST)
+    parser.add_argument("--port", type=int, default=GARDEN_PORT)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per connection")
+    parser.add_argument("--pipeline", type=int, default=8, help="requests in flight per connection")
+    parser.add_argument("--plants", type=int, default=10000, help="distinct plant ids to hit")
+    parser.add_argument("--water-ratio", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    elapsed, latencies, errors = asyncio.run(run_load(
+        args.host, args.port, args.connections, args.requests, args.pipeline,
+        args.plants, args.water_ratio, args.seed
+    ))
+
+    stats = summarize_timings(latencies)
+    print(f"📈 {len(latencies)} requests in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} req/s, {errors} errors)")
+    if stats:
+        print(f"   latency mean {stats['mean_ms']:.2f}ms  median {stats['median_ms']:.2f}ms  "
+              f"p95 {stats['p95_ms']:.2f}ms  p99 {stats['p99_ms']:.2f}ms  max {stats['max_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,11 @@ from .settings import *
 
 
 class Menu:
-    def __init__(self, screen):
-        self.screen = screen
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.set_scene(canvas)
         self.setup_fonts()
-        self.button_rect = None
+        self.setup_text()
     
     def setup_fonts(self):
         """Initialize menu fonts"""
@@ -23,25 +24,56 @@ class Menu:
             'instruction': pygame.font.SysFont("Arial", 16)
         }
     
+    def setup_text(self):
+        """Render the static menu text once"""
+        title_text = "🌱 Virtual Plant Buddy"
+        self.text = {
+            'title_shadow': self.fonts['title'].render(title_text, True, (50, 50, 50)),
+            'title': self.fonts['title'].render(title_text, True, (34, 139, 34)),
+            'subtitle': self.fonts['subtitle'].render(
+                "Watch your plant grow with love and care", True, (100, 100, 100)
+            ),
+            'button': self.fonts['button'].render(
+                "🌱 Start Growing!", True, COLORS['text_light']
+            ),
+            'instruction': self.fonts['instruction'].render(
+                "Click the button or press SPACE to begin your plant journey", 
+                True, (80, 80, 80)
+            )
+        }
+    
+    def set_scene(self, canvas, scale=1.0):
+        """Set the canvas the scene is drawn onto and its scale to the window"""
+        self.scene = canvas
+        self.scene_scale = scale
+    
     def draw(self, animation_time):
         """Draw the main menu"""
+        self.draw_scene(animation_time)
+        return self.draw_overlay(animation_time)
+    
+    def draw_scene(self, animation_time):
+        """Draw the animated menu background"""
         self._draw_animated_background(animation_time)
         self._draw_floating_particles(animation_time)
+    
+    def draw_overlay(self, animation_time):
+        """Draw the title, button and text on top of the scene"""
         self._draw_title()
         self._draw_subtitle(animation_time)
-        self.button_rect = self._draw_play_button()
+        button_rect = self._draw_play_button()
         self._draw_instructions()
         
-        return self.button_rect
+        return button_rect
     
     def _draw_animated_background(self, animation_time):
         """Draw animated gradient background"""
-        height = self.screen.get_height()
-        width = self.screen.get_width()
+        height = self.scene.get_height()
+        width = self.scene.get_width()
         
         for y in range(height):
             color_ratio = y / height
-            wave = math.sin(animation_time * 0.5 + y * 0.01) * 20
+            wave = math.sin(animation_time * 0.5 + y / self.scene_scale * 0.01) * 20
             
             r = int(100 + (180 - 100) * color_ratio + wave)
             g = int(150 + (255 - 150) * color_ratio + wave)
@@ -52,7 +84,7 @@ class Menu:
             g = max(0, min(255, g))
             b = max(0, min(255, b))
             
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (width, y))
+            self.scene.draw_line((r, g, b), (0, y), (width, y))
     
     def _draw_floating_particles(self, animation_time):
         """Draw floating particle effects"""
@@ -69,59 +101,60 @@ class Menu:
             particle_size = 3 + 2 * math.sin(animation_time * 2 + i)
             
             color = particle_colors[i % len(particle_colors)]
-            pygame.draw.circle(
-                self.screen, color, 
-                (int(particle_x), int(particle_y)), 
-                int(particle_size)
+            self.scene.draw_circle(
+                color, 
+                (int(particle_x * self.scene_scale), int(particle_y * self.scene_scale)), 
+                max(1, int(particle_size * self.scene_scale))
             )
     
     def _draw_title(self):
         """Draw game title with shadow effect"""
-        title_text = "🌱 Virtual Plant Buddy"
-        
         # Shadow
-        title_shadow = self.fonts['title'].render(title_text, True, (50, 50, 50))
+        title_shadow = self.text['title_shadow']
         shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH//2 + 3, SCREEN_HEIGHT//2 - 100 + 3))
-        self.screen.blit(title_shadow, shadow_rect)
+        self.canvas.blit(title_shadow, shadow_rect)
         
         # Main title
-        title_surface = self.fonts['title'].render(title_text, True, (34, 139, 34))
+        title_surface = self.text['title']
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
-        self.screen.blit(title_surface, title_rect)
+        self.canvas.blit(title_surface, title_rect)
     
     def _draw_subtitle(self, animation_time):
         """Draw animated subtitle"""
         subtitle_scale = 1 + 0.1 * math.sin(animation_time * 2)
-        subtitle_text = "Watch your plant grow with love and care"
-        subtitle_surface = self.fonts['subtitle'].render(subtitle_text, True, (100, 100, 100))
+        subtitle_surface = self.text['subtitle']
         
         # Scale for breathing effect
         scaled_width = int(subtitle_surface.get_width() * subtitle_scale)
         scaled_height = int(subtitle_surface.get_height() * subtitle_scale)
-        scaled_subtitle = pygame.transform.scale(subtitle_surface, (scaled_width, scaled_height))
-        
-        subtitle_rect = scaled_subtitle.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
-        self.screen.blit(scaled_subtitle, subtitle_rect)
+        self.canvas.draw_image(
+            subtitle_surface, (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50), 
+            (scaled_width, scaled_height)
+        )
     
-    def _draw_play_button(self):
-        """Draw interactive play button"""
+    def get_button_rect(self):
+        """Get the clickable play button area, no drawing needed"""
         button_width, button_height = 200, 60
         button_x = SCREEN_WIDTH//2 - button_width//2
         button_y = SCREEN_HEIGHT//2 + 20
+        return pygame.Rect(button_x, button_y, button_width, button_height)
+    
+    def _draw_play_button(self):
+        """Draw interactive play button"""
+        button_rect = self.get_button_rect()
+        button_width, button_height = button_rect.size
+        button_y = button_rect.y
         
         # Check hover state
         mouse_pos = pygame.mouse.get_pos()
-        button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
         is_hovering = button_rect.collidepoint(mouse_pos)
         
         # Button appearance based on hover
         if is_hovering:
             button_color = COLORS['button_hover']
-            text_color = COLORS['text_light']
             button_scale = 1.05
         else:
             button_color = COLORS['button_normal']
-            text_color = COLORS['text_light']
             button_scale = 1.0
         
         # Scale button
@@ -132,29 +165,26 @@ class Menu:
         
         # Button shadow
         shadow_rect = pygame.Rect(scaled_x + 3, scaled_y + 3, scaled_width, scaled_height)
-        pygame.draw.rect(self.screen, (20, 20, 20), shadow_rect, border_radius=10)
+        self.canvas.draw_rect((20, 20, 20), shadow_rect, border_radius=10)
         
         # Main button
         main_button_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
-        pygame.draw.rect(self.screen, button_color, main_button_rect, border_radius=10)
-        pygame.draw.rect(self.screen, COLORS['text_light'], main_button_rect, 3, border_radius=10)
+        self.canvas.draw_rect(button_color, main_button_rect, border_radius=10)
+        self.canvas.draw_rect(COLORS['text_light'], main_button_rect, 3, border_radius=10)
         
         # Button text
-        button_text = self.fonts['button'].render("🌱 Start Growing!", True, text_color)
+        button_text = self.text['button']
         button_text_rect = button_text.get_rect(center=main_button_rect.center)
-        self.screen.blit(button_text, button_text_rect)
+        self.canvas.blit(button_text, button_text_rect)
         
         return button_rect
     
     def _draw_instructions(self):
         """Draw menu instructions"""
-        instruction_text = "Click the button or press SPACE to begin your plant journey"
-        instruction_surface = self.fonts['instruction'].render(instruction_text, True, (80, 80, 80))
+        instruction_surface = self.text['instruction']
         instruction_rect = instruction_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
-        self.screen.blit(instruction_surface, instruction_rect)
+        self.canvas.blit(instruction_surface, instruction_rect)
     
     def handle_click(self, mouse_pos):
         """Handle menu button clicks"""
-        if self.button_rect and self.button_rect.collidepoint(mouse_pos):
-            return True
-        return False
\ No newline at end of file
+        return self.get_button_rect().collidepoint(mouse_pos)
\ No newline at end of file
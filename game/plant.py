@@ -39,10 +39,10 @@ class Plant:
                 current_stage = stage
                 if i + 1 < len(GROWTH_STAGES):
                     next_stage = GROWTH_STAGES[i + 1]
-                    # Start transition 3 seconds early
-                    if age >= next_stage["start_age"] - 3:
-                        transition_start = next_stage["start_age"] - 3
-                        transition_progress = min(1.0, (age - transition_start) / 3.0)
+                    # Start transition a few seconds early
+                    if age >= next_stage["start_age"] - TRANSITION_DURATION:
+                        transition_start = next_stage["start_age"] - TRANSITION_DURATION
+                        transition_progress = min(1.0, (age - transition_start) / TRANSITION_DURATION)
         
         return current_stage, next_stage, transition_progress
     
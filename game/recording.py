@@ -0,0 +1,100 @@
+"""
+Input Recording
+Captures input events and frame timing so a session can be replayed
+"""
+
+import gzip
+import json
+import os
+import pygame
+
+RECORDING_VERSION = 1
+
+# Events the game reacts to and the attributes needed to rebuild them
+RECORDED_EVENTS = {
+    pygame.QUIT: (),
+    pygame.KEYDOWN: ("key", "mod", "unicode", "scancode"),
+    pygame.MOUSEBUTTONDOWN: ("pos", "button"),
+}
+
+
+def serialize_event(event):
+    """Turn a pygame event into a compact JSON-friendly list"""
+    attrs = {name: getattr(event, name) for name in RECORDED_EVENTS[event.type]
+             if hasattr(event, name)}
+    return [event.type, attrs] if attrs else [event.type]
+
+
+def deserialize_event(data):
+    """Rebuild a pygame event from serialize_event output"""
+    attrs = data[1] if len(data) > 1 else {}
+    if "pos" in attrs:
+        attrs["pos"] = tuple(attrs["pos"])
+    return pygame.event.Event(data[0], attrs)
+
+
+class InputRecorder:
+    """Writes a gzip'd JSON lines file: header, one line per frame, footer"""
+
+    def __init__(self, path, initial_state, game_state):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.frames = 0
+        self.file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({
+            "version": RECORDING_VERSION,
+            "pygame": pygame.version.ver,
+            "initial_state": initial_state,
+            "game_state": game_state,
+        })
+
+    def _write(self, data):
+        self.file.write(json.dumps(data, separators=(",", ":")))
+        self.file.write("\n")
+
+    def record_frame(self, dt, events):
+        """Record one frame's delta time and the events the game handles"""
+        recorded = [serialize_event(event) for event in events
+                    if event.type in RECORDED_EVENTS]
+        self._write([dt, recorded] if recorded else [dt])
+        self.frames += 1
+
+    def close(self, final_state):
+        """Write the final plant state and close the file"""
+        if self.file is None:
+            return
+        self._write({"final_state": final_state, "frames": self.frames})
+        self.file.close()
+        self.file = None
+
+
+def load_recording(path):
+    """Load a recording, returns (header, frames, footer)
+
+    Frames are (dt, events) pairs. The footer is None if the session
+    did not shut down cleanly.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {header.get('version')}")
+
+        frames = []
+        footer = None
+        try:
+            for line in f:
+                data = json.loads(line)
+                if isinstance(data, dict):
+                    footer = data
+                    break
+                dt = data[0]
+                events = [deserialize_event(event) for event in data[1]] if len(data) > 1 else []
+                frames.append((dt, events))
+        except (EOFError, json.JSONDecodeError):
+            # Truncated by a crash, keep what was written
+            pass
+
+    return header, frames, footer
@@ -0,0 +1,74 @@
+"""
+Reduced Resolution Rendering
+Renders the scene to an internal target and upscales it to the window
+"""
+
+from .settings import *
+from .utils import clamp
+
+
+class RenderScaler:
+    def __init__(self, canvas, scale=RENDER_SCALE, scale_filter=RENDER_SCALE_FILTER,
+                 adaptive=RENDER_SCALE_ADAPTIVE):
+        if scale_filter not in ("smooth", "nearest"):
+            raise ValueError(f"Unknown scaling filter: {scale_filter}")
+
+        self.canvas = canvas
+        self.scale_filter = scale_filter
+        self.adaptive = adaptive
+        self.budget = 1000.0 / FPS
+        self.average_frame_time = None
+        self.cooldown = RENDER_SCALE_COOLDOWN
+        self.set_scale(scale)
+
+    @property
+    def target(self):
+        """Canvas the scene should be drawn onto"""
+        return self.scene if self.scene is not None else self.canvas
+
+    def set_scale(self, scale):
+        """Change the internal resolution"""
+        self.scale = clamp(scale, RENDER_SCALE_MIN, RENDER_SCALE_MAX)
+
+        if self.scale >= 1.0:
+            # Full resolution draws straight onto the window
+            self.scene = None
+            return
+
+        width, height = self.canvas.get_size()
+        size = (max(1, int(width * self.scale)), max(1, int(height * self.scale)))
+        self.scene = self.canvas.create_target(size, self.scale_filter)
+
+    def present(self):
+        """Upscale the internal target onto the window"""
+        if self.scene is not None:
+            self.canvas.draw_target(self.scene)
+
+    def record_frame_time(self, frame_time):
+        """Track frame time in ms and adapt the scale, returns True if it changed"""
+        if not self.adaptive:
+            return False
+
+        if self.average_frame_time is None:
+            self.average_frame_time = frame_time
+        else:
+            self.average_frame_time += (frame_time - self.average_frame_time) * 0.1
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return False
+
+        new_scale = self.scale
+        if self.average_frame_time > self.budget:
+            new_scale = self.scale - RENDER_SCALE_STEP
+        elif self.average_frame_time < self.budget * 0.5:
+            new_scale = self.scale + RENDER_SCALE_STEP
+
+        new_scale = clamp(new_scale, RENDER_SCALE_MIN, RENDER_SCALE_MAX)
+        if new_scale == self.scale:
+            return False
+
+        self.set_scale(new_scale)
+        self.average_frame_time = None
+        self.cooldown = RENDER_SCALE_COOLDOWN
+        return True
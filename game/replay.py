@@ -0,0 +1,102 @@
+"""
+Replay Driver
+Runs GameManager headless from a recording and reports frame times
+
+Usage:
+    python -m game.replay data/session.rec.gz [--realtime] [--fixed-dt DT] [--no-render]
+"""
+
+import argparse
+import os
+import sys
+import time
+from .utils import summarize_timings
+
+
+def replay(path, fixed_dt=None, realtime=False, render=True):
+    """Replay a recording headless and return the result
+
+    By default every frame uses its recorded dt and runs as fast as
+    possible. realtime paces frames to the recorded dt, fixed_dt feeds
+    the same dt to every frame instead (the final state will then
+    usually differ from the recording).
+    """
+    # Headless unless a video driver was picked explicitly
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    import pygame
+    from .game_manager import GameManager
+    from .recording import load_recording
+
+    header, frames, footer = load_recording(path)
+
+    game = GameManager(autosave=False)
+    game.plant.load_state(header["initial_state"])
+    game.game_state = header["game_state"]
+
+    frame_times = []
+    for recorded_dt, events in frames:
+        dt = fixed_dt if fixed_dt is not None else recorded_dt
+
+        start = time.perf_counter()
+        if render:
+            game.step(dt, events)
+        else:
+            game.handle_events(events)
+            game.update(dt)
+        elapsed = time.perf_counter() - start
+        frame_times.append(elapsed)
+
+        if realtime and elapsed < dt:
+            time.sleep(dt - elapsed)
+
+        if not game.running:
+            break
+
+    final_state = game.plant.get_state()
+    expected_state = footer["final_state"] if footer else None
+    pygame.quit()
+
+    return {
+        "final_state": final_state,
+        "expected_state": expected_state,
+        "matches": expected_state is not None and final_state == expected_state,
+        "stats": summarize_timings(frame_times),
+    }
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Replay a Virtual Plant Buddy recording")
+    parser.add_argument("path", help="recording made with main.py --record")
+    parser.add_argument("--realtime", action="store_true",
+                        help="pace frames to the recorded dt instead of running flat out")
+    parser.add_argument("--fixed-dt", type=float, metavar="DT",
+                        help="use the same dt for every frame instead of the recorded one")
+    parser.add_argument("--no-render", action="store_true", help="skip rendering")
+    args = parser.parse_args()
+
+    result = replay(args.path, args.fixed_dt, args.realtime, not args.no_render)
+
+    stats = result["stats"]
+    print(f"🎬 Replayed {stats.get('count', 0)} frames in {stats.get('total_s', 0):.2f}s")
+    if stats:
+        print(f"   mean {stats['mean_ms']:.2f}ms  median {stats['median_ms']:.2f}ms  "
+              f"p95 {stats['p95_ms']:.2f}ms  p99 {stats['p99_ms']:.2f}ms  "
+              f"max {stats['max_ms']:.2f}ms")
+
+    if result["expected_state"] is None:
+        print("⚠️ Recording has no final state (session did not exit cleanly)")
+        return 0
+    if result["matches"]:
+        print("✅ Final plant state matches the recording")
+        return 0
+
+    print("❌ Final plant state differs from the recording")
+    print(f"   expected: {result['expected_state']}")
+    print(f"   got:      {result['final_state']}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""
+Garden Server
+Headless asyncio server hosting many plants for many players
+
+Protocol: one JSON object per line, one JSON response line per request.
+    {"cmd": "water", "plant": "alice"}  -> {"ok": true, "watered": true, "state": {...}}
+    {"cmd": "query", "plant": "alice"}  -> {"ok": true, "state": {...}}
+    {"cmd": "reset", "plant": "alice"}  -> {"ok": true, "state": {...}}
+    {"cmd": "stats"}                    -> {"ok": true, "plants": 12, "ticks": 340, ...}
+An optional "id" field is echoed back so clients can pipeline requests.
+Plants are created the first time they are referenced.
+
+Usage:
+    python -m game.server [--host HOST] [--port PORT] [--save PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from .settings import *
+from .plant import Plant
+
+
+class GardenServer:
+    def __init__(self, host=GARDEN_HOST, port=GARDEN_PORT, save_path=GARDEN_SAVE_FILE,
+                 tick_interval=1.0, save_interval=GARDEN_SAVE_INTERVAL):
+        self.host = host
+        self.port = port
+        self.save_path = save_path
+        self.tick_interval = tick_interval
+        self.save_interval = save_interval
+
+        self.plants = {}
+        self.ticks = 0
+        self.requests = 0
+        self.dirty = False
+        self.connections = 0
+        self.server = None
+        self.tasks = []
+        self.pending_write = None
+
+    # Plants
+
+    def load(self):
+        """Load saved plants"""
+        if not self.save_path or not os.path.exists(self.save_path):
+            return
+
+        try:
+            with open(self.save_path, "r") as f:
+                saved = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️ Could not load {self.save_path}: {e}")
+            return
+
+        for plant_id, state in saved.get("plants", {}).items():
+            plant = Plant({})
+            plant.load_state(state)
+            self.plants[plant_id] = plant
+        self.ticks = saved.get("ticks", 0)
+
+    def get_plant(self, plant_id):
+        """Get a plant, creating it on first use"""
+        plant = self.plants.get(plant_id)
+        if plant is None:
+            if len(self.plants) >= GARDEN_MAX_PLANTS:
+                raise ValueError("garden is full")
+            plant = self.plants[plant_id] = Plant({})
+        return plant
+
+    async def tick(self):
+        """Update every plant once, yielding between batches"""
+        plants = list(self.plants.values())
+        for start in range(0, len(plants), GARDEN_TICK_BATCH):
+            for plant in plants[start:start + GARDEN_TICK_BATCH]:
+                plant.update(self.tick_interval)
+            # Let client requests in between batches
+            await asyncio.sleep(0)
+
+        self.ticks += 1
+        self.dirty = True
+
+    async def tick_loop(self):
+        """Tick at a fixed cadence, like GameManager does once per second"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + self.tick_interval
+        while True:
+            await asyncio.sleep(max(0, next_tick - loop.time()))
+            await self.tick()
+            next_tick += self.tick_interval
+
+    # Persistence
+
+    def _snapshot(self):
+        return {
+            "ticks": self.ticks,
+            "plants": {plant_id: plant.get_state() for plant_id, plant in self.plants.items()},
+        }
+
+    @staticmethod
+    def _write_snapshot(path, snapshot):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write then rename so a crash never leaves a half-written save
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    async def save(self):
+        """Save all plants in one batch, writing off the event loop"""
+        # Never run two writes at once, even if a save_loop was cancelled mid-write
+        if self.pending_write is not None and not self.pending_write.done():
+            await asyncio.wait([self.pending_write])
+
+        if not self.save_path or not self.dirty:
+            return
+
+        # Snapshot on the loop so it is consistent, write in a thread
+        snapshot = self._snapshot()
+        self.dirty = False
+        self.pending_write = asyncio.ensure_future(
+            asyncio.to_thread(self._write_snapshot, self.save_path, snapshot)
+        )
+        try:
+            await asyncio.shield(self.pending_write)
+        except OSError as e:
+            self.dirty = True
+            print(f"⚠️ Could not save {self.save_path}: {e}")
+
+    async def save_loop(self):
+        while True:
+            await asyncio.sleep(self.save_interval)
+            await self.save()
+
+    # Requests
+
+    def handle_request(self, request):
+        """Run one command and return the response"""
+        cmd = request.get("cmd")
+        if cmd == "stats":
+            return {
+                "ok": True, "plants": len(self.plants), "ticks": self.ticks,
+                "requests": self.requests, "connections": self.connections,
+            }
+
+        if cmd not in ("water", "query", "reset"):
+            return {"ok": False, "error": f"unknown command: {cmd}"}
+
+        plant_id = request.get("plant")
+        if not isinstance(plant_id, str) or not plant_id:
+            return {"ok": False, "error": "missing plant"}
+
+        try:
+            plant = self.get_plant(plant_id)
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}
+
+        if cmd == "water":
+            watered = plant.water()
+            self.dirty = True
+            return {"ok": True, "watered": watered, "state": plant.get_state()}
+
+        if cmd == "query":
+            current_stage, _, _ = plant.get_current_stage_info()
+            return {"ok": True, "stage": current_stage["name"], "state": plant.get_state()}
+
+        # reset
+        plant.reset()
+        self.dirty = True
+        return {"ok": True, "state": plant.get_state()}
+
+    async def handle_client(self, reader, writer):
+        """Serve one connection, one request line at a time"""
+        if self.connections >= GARDEN_MAX_CONNECTIONS:
+            writer.write(b'{"ok":false,"error":"too many connections"}\n')
+            await writer.drain()
+            writer.close()
+            return
+
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line longer than the stream limit
+                    writer.write(b'{"ok":false,"error":"request too long"}\n')
+                    break
+                if not line:
+                    break
+
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be an object")
+                except ValueError as e:
+                    response = {"ok": False, "error": str(e)}
+                else:
+                    try:
+                        response = self.handle_request(request)
+                    except ValueError as e:
+                        response = {"ok": False, "error": str(e)}
+                    # Every reply to a parsed request carries its id
+                    if "id" in request:
+                        response["id"] = request["id"]
+
+                self.requests += 1
+                writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+
+                # Backpressure: stop reading from clients that don't read replies
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    # Lifecycle
+
+    async def start(self):
+        """Load saved plants and start serving"""
+        self.load()
+        self.server = await asyncio.start_server(
+            self.handle_client, self.host, self.port, limit=GARDEN_MAX_LINE
+        )
+        self.tasks = [
+            asyncio.create_task(self.tick_loop()),
+            asyncio.create_task(self.save_loop()),
+        ]
+
+    async def stop(self):
+        """Stop serving and save everything"""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+        self.dirty = True
+        await self.save()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"🌱 Garden server listening on {self.host}:{self.port} "
+              f"({len(self.plants)} plants)")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Virtual Plant Buddy garden server")
+    parser.add_argument("--host", default=GARDEN_HOST)
+    parser.add_argument("--port", type=int, default=GARDEN_PORT)
+    parser.add_argument("--save", default=GARDEN_SAVE_FILE, help="garden save file")
+    args = parser.parse_args()
+
+    server = GardenServer(args.host, args.port, args.save)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n🌱 Garden server stopped")
+
+
+if __name__ == "__main__":
+    main()
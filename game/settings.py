@@ -8,6 +8,21 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Drawing backend: "surface" (software blits) or "texture" (pygame._sdl2
+# renderer, hardware accelerated where available)
+RENDER_BACKEND = "surface"
+
+# Performance mode: render the scene at a reduced internal resolution and
+# upscale it once per frame (HUD and text stay at full resolution)
+PERFORMANCE_MODE = False
+RENDER_SCALE = 0.5               # Internal resolution as a fraction of the window
+RENDER_SCALE_FILTER = "smooth"   # "smooth" or "nearest"
+RENDER_SCALE_ADAPTIVE = True     # Adjust the scale when frame time goes over budget
+RENDER_SCALE_MIN = 0.25
+RENDER_SCALE_MAX = 1.0
+RENDER_SCALE_STEP = 0.125
+RENDER_SCALE_COOLDOWN = 30       # Frames to wait between scale changes
+
 # Growth stage configuration
 GROWTH_STAGES = [
     {
@@ -42,6 +57,22 @@ GROWTH_ANIMATION_SPEED = 2.0
 WATER_EFFECT_DURATION = 1.0
 BREATHING_SPEED = 1.5
 
+# Stage transition settings
+TRANSITION_DURATION = 3          # Seconds before a stage boundary the crossfade starts
+TRANSITION_PREFETCH_TIME = 1     # Seconds before a transition to build its frames
+
+# Stat history (one sample per plant update, i.e. per second)
+HISTORY_RAW_SAMPLES = 600        # Raw samples kept (10 minutes)
+HISTORY_TIERS = (                # (samples merged into one min/max, capacity)
+    (60, 1440),                  # Per minute for a day
+    (60, 720),                   # Per hour for 30 days
+)
+HISTORY_GRAPH_STEP = 2           # Pixels per sample in the history graph
+
+# Frame capture (python main.py --capture DIR)
+CAPTURE_FORMAT = "png"           # "png" sequence or "raw" rgb0 video
+CAPTURE_POOL_SIZE = 8            # Preallocated frame buffers; frames drop when all are busy
+
 # Game states
 MENU = "menu"
 PLAYING = "playing"
@@ -69,4 +100,22 @@ WATER_LOSS_NORMAL = 1
 WATER_LOSS_STRESSED = 2
 HAPPINESS_THRESHOLD_STRESSED = 30
 HAPPINESS_THRESHOLD_HAPPY = 60
-NEGLECT_TIME_THRESHOLD = 15
\ No newline at end of file
+NEGLECT_TIME_THRESHOLD = 15
+
+# Garden server (python -m game.server)
+GARDEN_HOST = "127.0.0.1"
+GARDEN_PORT = 8765
+GARDEN_SAVE_FILE = "data/garden.json"
+GARDEN_SAVE_INTERVAL = 10        # Seconds between batched saves
+GARDEN_TICK_BATCH = 1000         # Plants updated before yielding to clients
+GARDEN_MAX_PLANTS = 100000
+GARDEN_MAX_CONNECTIONS = 1000
+GARDEN_MAX_LINE = 4096           # Longest accepted request line in bytes
+
+# Sharded simulation (python -m game.sharded)
+SHARD_TICK_TIMEOUT = 60          # Seconds shards wait for each other within one tick
+SHARD_MONITOR_INTERVAL = 0.5     # Seconds between worker liveness checks
+
+# Parameter sweeps (python -m game.sweep)
+SWEEP_OUTPUT_FILE = "data/sweep.csv"
+SWEEP_CHUNK_PLANTS = 262144      # Plants simulated together per worker task
@@ -0,0 +1,214 @@
+"""
+Vectorized Plant Simulation
+Plant.update and Plant.water applied to whole arrays of plants at once
+
+The kernels restate the Plant rules, so check them after changing either:
+    python -m game.simulation --check [--plants 500] [--ticks 200]
+"""
+
+import argparse
+import random
+import sys
+import numpy as np
+from multiprocessing import shared_memory
+from .settings import *
+
+# Plant.state fields and their array dtypes
+STATE_FIELDS = (
+    ("age", np.int64),
+    ("water", np.int64),
+    ("growth_progress", np.float64),
+    ("last_watered", np.int64),
+    ("happiness", np.int64),
+)
+
+# Care-balance settings the kernels read; override per call with params,
+# either as scalars or as arrays broadcast against the plants
+DEFAULT_PARAMS = {
+    "WATER_GAIN_PER_ACTION": WATER_GAIN_PER_ACTION,
+    "HAPPINESS_GAIN_PER_WATER": HAPPINESS_GAIN_PER_WATER,
+    "WATER_LOSS_NORMAL": WATER_LOSS_NORMAL,
+    "WATER_LOSS_STRESSED": WATER_LOSS_STRESSED,
+    "HAPPINESS_THRESHOLD_STRESSED": HAPPINESS_THRESHOLD_STRESSED,
+    "HAPPINESS_THRESHOLD_HAPPY": HAPPINESS_THRESHOLD_HAPPY,
+    "NEGLECT_TIME_THRESHOLD": NEGLECT_TIME_THRESHOLD,
+}
+
+DEFAULT_STATE = {
+    "age": 0,
+    "water": 100,
+    "growth_progress": 0.0,
+    "last_watered": 0,
+    "happiness": 50
+}
+
+
+def update_plants(state, params=None):
+    """Plant.update for every plant in a dict of field arrays (in place)"""
+    p = DEFAULT_PARAMS if params is None else {**DEFAULT_PARAMS, **params}
+    age = state["age"]
+    water = state["water"]
+    happiness = state["happiness"]
+
+    # Age the plants
+    age += 1
+
+    # Water consumption
+    water_loss = np.where(
+        happiness < p["HAPPINESS_THRESHOLD_STRESSED"],
+        p["WATER_LOSS_STRESSED"], p["WATER_LOSS_NORMAL"]
+    )
+    np.maximum(water - water_loss, 0, out=water)
+
+    # Neglected plants lose happiness
+    neglected = (age - state["last_watered"]) > p["NEGLECT_TIME_THRESHOLD"]
+    np.maximum(happiness - 1, 0, out=happiness, where=neglected)
+
+    # Boost growth if well cared for
+    thriving = (water > 50) & (happiness > p["HAPPINESS_THRESHOLD_HAPPY"])
+    np.add(state["growth_progress"], 0.1, out=state["growth_progress"], where=thriving)
+
+
+def water_plants(state, mask, params=None):
+    """Plant.water for the plants selected by mask (in place)"""
+    p = DEFAULT_PARAMS if params is None else {**DEFAULT_PARAMS, **params}
+    water = state["water"]
+    happiness = state["happiness"]
+
+    np.minimum(water + p["WATER_GAIN_PER_ACTION"], 100, out=water, where=mask)
+    np.minimum(happiness + p["HAPPINESS_GAIN_PER_WATER"], 100, out=happiness, where=mask)
+    np.copyto(state["last_watered"], state["age"], where=mask)
+
+
+def reset_plants(state):
+    """Plant.reset for every plant (in place)"""
+    for name, _ in STATE_FIELDS:
+        state[name][...] = DEFAULT_STATE[name]
+
+
+class SharedPlantState:
+    """Plant state arrays living in one multiprocessing.shared_memory block"""
+
+    def __init__(self, shm, count, owner):
+        self.shm = shm
+        self.count = count
+        self.owner = owner
+        self.arrays = {}
+
+        offset = 0
+        for name, dtype in STATE_FIELDS:
+            self.arrays[name] = np.ndarray((count,), dtype=dtype, buffer=shm.buf, offset=offset)
+            offset += count * np.dtype(dtype).itemsize
+
+    @staticmethod
+    def nbytes(count):
+        return sum(count * np.dtype(dtype).itemsize for _, dtype in STATE_FIELDS)
+
+    @classmethod
+    def create(cls, count):
+        """Allocate shared state for count plants, initialized like Plant()"""
+        shm = shared_memory.SharedMemory(create=True, size=max(1, cls.nbytes(count)))
+        state = cls(shm, count, owner=True)
+        reset_plants(state.arrays)
+        return state
+
+    @classmethod
+    def attach(cls, name, count):
+        """Attach to shared state created in another process"""
+        return cls(shared_memory.SharedMemory(name=name), count, owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def view(self, start, stop):
+        """Field arrays for plants [start, stop), sharing memory"""
+        return {name: array[start:stop] for name, array in self.arrays.items()}
+
+    def copy(self):
+        """Private copy of every field array"""
+        return {name: array.copy() for name, array in self.arrays.items()}
+
+    def get_plant_state(self, index):
+        """State of one plant as a Plant.get_state() style dict"""
+        return {name: array[index].item() for name, array in self.arrays.items()}
+
+    def close(self):
+        """Detach, and free the block if this process created it"""
+        self.arrays = {}
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def check_rules(plants=500, ticks=200, seed=0):
+    """Run Plant and the kernels side by side from random states
+
+    Returns None if every plant matches after every tick, otherwise
+    (tick, index, kernel state, Plant state) for the first mismatch.
+    """
+    from .plant import Plant
+
+    rng = random.Random(seed)
+    reference = []
+    for _ in range(plants):
+        plant = Plant({})
+        age = rng.randrange(60)
+        plant.load_state({
+            "age": age,
+            "water": rng.randrange(101),
+            "last_watered": age - rng.randrange(2 * NEGLECT_TIME_THRESHOLD),
+            "happiness": rng.randrange(101),
+        })
+        reference.append(plant)
+
+    state = {
+        name: np.array([plant.state[name] for plant in reference], dtype=dtype)
+        for name, dtype in STATE_FIELDS
+    }
+
+    for tick in range(1, ticks + 1):
+        watered = np.array([rng.random() < 0.1 for _ in range(plants)])
+        water_plants(state, watered)
+        update_plants(state)
+
+        for index, plant in enumerate(reference):
+            if watered[index]:
+                plant.water()
+            plant.update(1)
+
+            kernel_state = {name: state[name][index].item() for name, _ in STATE_FIELDS}
+            if kernel_state != plant.state:
+                return tick, index, kernel_state, plant.get_state()
+
+    return None
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Vectorized plant simulation")
+    parser.add_argument("--check", action="store_true",
+                        help="compare the kernels with Plant.update/Plant.water")
+    parser.add_argument("--plants", type=int, default=500)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not args.check:
+        parser.print_help()
+        return 0
+
+    mismatch = check_rules(args.plants, args.ticks, args.seed)
+    if mismatch is None:
+        print(f"✅ Kernels match Plant for {args.plants} plants over {args.ticks} ticks")
+        return 0
+
+    tick, index, kernel_state, plant_state = mismatch
+    print(f"❌ Plant {index} differs after tick {tick}")
+    print(f"   kernels: {kernel_state}")
+    print(f"   Plant:   {plant_state}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
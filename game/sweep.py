@@ -0,0 +1,213 @@
+"""
+Care-Balance Parameter Sweep
+Simulates a grid of settings and care policies and reports outcome distributions
+
+Grid axes are settings from simulation.DEFAULT_PARAMS and the care policy axes:
+    WATER_INTERVAL   ticks between waterings (0 = never water)
+    NEGLECT_CHANCE   chance a scheduled watering is skipped
+Values are comma lists or inclusive start:stop:step ranges.
+
+Usage:
+    python -m game.sweep --grid WATER_LOSS_NORMAL=1,2 \\
+        --grid NEGLECT_TIME_THRESHOLD=5:30:1 --grid WATER_INTERVAL=1:40:1 \\
+        --grid NEGLECT_CHANCE=0,0.1,0.25,0.5 --plants 1000 --ticks 120
+"""
+
+import argparse
+import csv
+import itertools
+import math
+import multiprocessing
+import os
+import time
+import numpy as np
+from .settings import *
+from .simulation import STATE_FIELDS, DEFAULT_STATE, DEFAULT_PARAMS, update_plants, water_plants
+
+DEFAULT_POLICY = {
+    "WATER_INTERVAL": 10,
+    "NEGLECT_CHANCE": 0.0,
+}
+
+SWEEP_DEFAULTS = {**DEFAULT_PARAMS, **DEFAULT_POLICY}
+
+# Stages only depend on age, which care never changes, so sweeping them
+# would just repeat identical rows
+STAGE_PARAMS = {f"{stage['name'].upper()}_START_AGE" for stage in GROWTH_STAGES}
+
+METRICS = ("stressed_ticks", "final_happiness", "growth_progress")
+
+
+def parse_values(text):
+    """Parse "1,2,3" or an inclusive "start:stop:step" range"""
+    def number(value):
+        try:
+            return float(value) if any(c in value for c in ".eE") else int(value)
+        except ValueError:
+            raise ValueError(f"Not a number: {value!r}") from None
+
+    if ":" in text:
+        parts = text.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"Ranges are start:stop:step, got {text!r}")
+        start, stop, step = (number(part) for part in parts)
+        if step == 0:
+            raise ValueError(f"Range step must not be zero: {text!r}")
+        # Inclusive of stop, with slack for float steps like 0:1:0.1
+        count = math.floor((stop - start) / step + 1e-9) + 1
+        if count < 1:
+            raise ValueError(f"Range is empty: {text!r}")
+        return [start + step * i for i in range(count)]
+    return [number(value) for value in text.split(",")]
+
+
+def build_configs(grid):
+    """Expand {name: [values]} into one config dict per grid point"""
+    no_effect = set(grid) & STAGE_PARAMS
+    if no_effect:
+        raise ValueError(
+            f"{', '.join(sorted(no_effect))} cannot change any outcome: "
+            "stages only depend on age, not on care"
+        )
+
+    unknown = set(grid) - set(SWEEP_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {', '.join(sorted(unknown))}")
+
+    if any(not 0 <= value <= 1 for value in grid.get("NEGLECT_CHANCE", ())):
+        raise ValueError("NEGLECT_CHANCE must be between 0 and 1")
+    if any(value < 0 for value in grid.get("WATER_INTERVAL", ())):
+        raise ValueError("WATER_INTERVAL must be 0 (never water) or more")
+
+    names = list(grid)
+    return [
+        {**SWEEP_DEFAULTS, **dict(zip(names, values))}
+        for values in itertools.product(*(grid[name] for name in names))
+    ]
+
+
+def _per_plant(configs, name, plants):
+    """A scalar if every config agrees, else one value per plant"""
+    values = [config[name] for config in configs]
+    if all(value == values[0] for value in values):
+        return values[0]
+    return np.repeat(np.array(values), plants)
+
+
+def simulate_configs(configs, plants, ticks, seed):
+    """Simulate plants per config for ticks, return one result row per config"""
+    count = len(configs) * plants
+    state = {name: np.full(count, DEFAULT_STATE[name], dtype=dtype) for name, dtype in STATE_FIELDS}
+    params = {name: _per_plant(configs, name, plants) for name in DEFAULT_PARAMS}
+
+    interval = _per_plant(configs, "WATER_INTERVAL", plants)
+    safe_interval = np.maximum(interval, 1)
+    neglect_chance = _per_plant(configs, "NEGLECT_CHANCE", plants)
+    rng = np.random.default_rng(seed)
+
+    stressed_ticks = np.zeros(count, dtype=np.int64)
+
+    for tick in range(1, ticks + 1):
+        # Care policy: water on schedule unless the player neglects it
+        due = (interval > 0) & (tick % safe_interval == 0)
+        if np.any(neglect_chance):
+            due = due & (rng.random(count) >= neglect_chance)
+        water_plants(state, due, params)
+
+        update_plants(state, params)
+
+        stressed_ticks += state["happiness"] < params["HAPPINESS_THRESHOLD_STRESSED"]
+
+    outcomes = {
+        "stressed_ticks": stressed_ticks,
+        "final_happiness": state["happiness"],
+        "growth_progress": state["growth_progress"],
+    }
+    shape = (len(configs), plants)
+
+    rows = [dict(config) for config in configs]
+    for name in METRICS:
+        values = outcomes[name].reshape(shape)
+        means = values.mean(axis=1)
+        p10, p50, p90 = np.percentile(values, [10, 50, 90], axis=1)
+        for i, row in enumerate(rows):
+            row[f"{name}_mean"] = float(means[i])
+            row[f"{name}_p10"] = float(p10[i])
+            row[f"{name}_p50"] = float(p50[i])
+            row[f"{name}_p90"] = float(p90[i])
+
+    return rows
+
+
+def _simulate_chunk(args):
+    return simulate_configs(*args)
+
+
+def run_sweep(grid, plants=1000, ticks=120, workers=None, seed=0):
+    """Run the whole grid across a process pool, return rows in grid order"""
+    configs = build_configs(grid)
+    per_chunk = max(1, SWEEP_CHUNK_PLANTS // plants)
+    chunks = [
+        (configs[start:start + per_chunk], plants, ticks, seed + index)
+        for index, start in enumerate(range(0, len(configs), per_chunk))
+    ]
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(chunks)))
+    if workers == 1:
+        results = map(_simulate_chunk, chunks)
+        return [row for rows in results for row in rows]
+
+    with multiprocessing.Pool(workers) as pool:
+        results = pool.imap(_simulate_chunk, chunks)
+        return [row for rows in results for row in rows]
+
+
+def write_rows(path, rows):
+    """Write sweep results as CSV"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Care-balance parameter sweep")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=VALUES",
+                        help="sweep axis, e.g. WATER_INTERVAL=1:40:1 or NEGLECT_CHANCE=0,0.5")
+    parser.add_argument("--plants", type=int, default=1000, help="plants per config")
+    parser.add_argument("--ticks", type=int, default=120, help="simulated seconds")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=SWEEP_OUTPUT_FILE)
+    args = parser.parse_args()
+    if args.plants < 1 or args.ticks < 1:
+        parser.error("--plants and --ticks must be at least 1")
+
+    try:
+        grid = {}
+        for axis in args.grid:
+            name, _, values = axis.partition("=")
+            if not values:
+                parser.error(f"--grid expects NAME=VALUES, got {axis}")
+            grid[name] = parse_values(values)
+
+        start = time.perf_counter()
+        rows = run_sweep(grid, args.plants, args.ticks, args.workers, args.seed)
+        elapsed = time.perf_counter() - start
+    except ValueError as e:
+        parser.error(str(e))
+
+    write_rows(args.out, rows)
+    plant_ticks = len(rows) * args.plants * args.ticks
+    print(f"🧪 {len(rows):,} configs x {args.plants:,} plants x {args.ticks} ticks "
+          f"in {elapsed:.1f}s ({plant_ticks / elapsed:,.0f} plant-ticks/s)")
+    print(f"   Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
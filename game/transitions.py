@@ -0,0 +1,87 @@
+"""
+Stage Transition Rendering
+Pre-rendered crossfade frames for growth stage transitions
+"""
+
+import pygame
+from .settings import *
+
+
+class TransitionRenderer:
+    """Crossfade frames for the stage transition the plant is approaching
+
+    Age advances one second at a time, so transition progress can only be
+    a multiple of 1 / TRANSITION_DURATION. Only those in-between values get
+    a frame; progress 0 and 1 are drawn from the stage images directly.
+    """
+
+    def __init__(self, steps=TRANSITION_DURATION):
+        self.steps = max(1, steps)
+        self.stage_pair = None
+        self.frames = []
+
+    def prepare(self, plant):
+        """Build frames when the plant nears a stage boundary, evict them after"""
+        current_stage, next_stage, transition_progress = plant.get_current_stage_info()
+
+        # Past the last boundary the final stage is its own "next" stage
+        if next_stage is None or next_stage is current_stage or transition_progress >= 1:
+            self.clear()
+            return
+
+        prefetch_age = next_stage["start_age"] - TRANSITION_DURATION - TRANSITION_PREFETCH_TIME
+        if plant.state["age"] < prefetch_age:
+            self.clear()
+            return
+
+        stage_pair = (current_stage["name"], next_stage["name"])
+        if stage_pair != self.stage_pair:
+            self.stage_pair = stage_pair
+            self.frames = []
+
+        # Build one frame per call so the prefetch never causes a spike itself
+        if len(self.frames) < self.steps - 1:
+            progress = (len(self.frames) + 1) / self.steps
+            self.frames.append(
+                self._build_frame(plant.images, current_stage, next_stage, progress)
+            )
+
+    def clear(self):
+        """Drop any cached frames"""
+        self.stage_pair = None
+        self.frames = []
+
+    def has_frames(self):
+        """Check if every crossfade frame is ready"""
+        return bool(self.frames) and len(self.frames) == self.steps - 1
+
+    def get_frame(self, transition_progress):
+        """Get the pre-rendered frame nearest to the transition progress"""
+        index = round(transition_progress * self.steps) - 1
+        return self.frames[max(0, min(index, len(self.frames) - 1))]
+
+    def _build_frame(self, images, current_stage, next_stage, progress):
+        """Blend both stages at their native size for one transition step"""
+        current_img = images[current_stage["name"]]
+        next_img = images[next_stage["name"]]
+
+        # Next stage grows in with the transition
+        next_size = (int(next_img.get_width() * progress), int(next_img.get_height() * progress))
+
+        width = max(current_img.get_width(), next_size[0])
+        height = max(current_img.get_height(), next_size[1])
+        frame = pygame.Surface((width, height), pygame.SRCALPHA)
+        center = (width // 2, height // 2)
+
+        # Current stage fades out
+        current = current_img.copy()
+        current.set_alpha(int(255 * (1 - progress * 0.7)))
+        frame.blit(current, current.get_rect(center=center))
+
+        # Next stage fades in once the transition is under way
+        if progress > 0.3:
+            upcoming = pygame.transform.scale(next_img, next_size)
+            upcoming.set_alpha(int(255 * (progress - 0.3) / 0.7))
+            frame.blit(upcoming, upcoming.get_rect(center=center))
+
+        return frame
@@ -7,12 +7,18 @@ import pygame
 import math
 from .settings import *
 from .utils import create_gradient_background
+from .transitions import TransitionRenderer
+from .layers import CachedLayer
+from .graph import HistoryGraph
 
 
 class UI:
-    def __init__(self, screen):
-        self.screen = screen
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.set_scene(canvas)
+        self.transitions = TransitionRenderer()
         self.setup_fonts()
+        self.setup_hud()
     
     def setup_fonts(self):
         """Initialize all fonts"""
@@ -24,18 +30,35 @@ class UI:
             'small': pygame.font.SysFont("Arial", 16)
         }
     
+    def set_scene(self, canvas, scale=1.0):
+        """Set the canvas the scene is drawn onto and its scale to the window"""
+        self.scene = canvas
+        self.scene_scale = scale
+        
+        # The background is static, so render it once per scene size
+        self.background_layer = CachedLayer((0, 0) + canvas.get_size(), alpha=False)
+    
     def draw_game_background(self):
         """Draw the game background with gradient and ground"""
+        self.background_layer.update(None, self._render_game_background)
+        self.background_layer.draw(self.scene)
+    
+    def _render_game_background(self, surface):
+        """Render the gradient and ground into the background layer"""
         # Gradient background
         create_gradient_background(
-            self.screen, 
+            surface, 
             COLORS['background_start'], 
             COLORS['background_end']
         )
         
         # Ground
-        ground_rect = pygame.Rect(0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100)
-        pygame.draw.rect(self.screen, COLORS['ground'], ground_rect)
+        ground_height = int(100 * self.scene_scale)
+        ground_rect = pygame.Rect(
+            0, surface.get_height() - ground_height, 
+            surface.get_width(), ground_height
+        )
+        pygame.draw.rect(surface, COLORS['ground'], ground_rect)
     
     def draw_plant(self, plant, animation_time, water_effect_time):
         """Draw the plant with all effects"""
@@ -43,22 +66,31 @@ class UI:
         
         # Calculate position with sway
         sway = 5 * math.sin(animation_time * 0.8)
-        plant_x = SCREEN_WIDTH // 2 + sway
-        plant_y = SCREEN_HEIGHT // 2 + 50
+        plant_x = (SCREEN_WIDTH // 2 + sway) * self.scene_scale
+        plant_y = (SCREEN_HEIGHT // 2 + 50) * self.scene_scale
         
-        # Draw current stage
-        self._draw_plant_stage(
-            plant, current_stage, plant_x, plant_y, 
-            animation_time, water_effect_time, transition_progress
-        )
+        self.transitions.prepare(plant)
         
-        # Draw next stage during transition
-        if transition_progress > 0.3 and next_stage:
+        if 0 < transition_progress < 1 and self.transitions.has_frames():
+            # Crossfade using the nearest pre-rendered frame
+            self._draw_transition_frame(
+                plant, plant_x, plant_y, animation_time, 
+                water_effect_time, transition_progress
+            )
+        else:
+            # Draw current stage
             self._draw_plant_stage(
-                plant, next_stage, plant_x, plant_y,
-                animation_time, water_effect_time, transition_progress, 
-                is_next_stage=True
+                plant, current_stage, plant_x, plant_y, 
+                animation_time, water_effect_time, transition_progress
             )
+            
+            # Draw next stage during transition
+            if transition_progress > 0.3 and next_stage:
+                self._draw_plant_stage(
+                    plant, next_stage, plant_x, plant_y,
+                    animation_time, water_effect_time, transition_progress, 
+                    is_next_stage=True
+                )
         
         # Draw growth effects
         if plant.should_show_sparkles():
@@ -68,16 +100,14 @@ class UI:
                          water_effect_time, transition_progress, is_next_stage=False):
         """Draw a single plant stage"""
         img = plant.images[stage["name"]]
-        scale = plant.calculate_scale(1.0, animation_time, water_effect_time)
+        scale = plant.calculate_scale(self.scene_scale, animation_time, water_effect_time)
         
         if is_next_stage:
             scale *= transition_progress
         
-        # Scale image
         scaled_size = (int(img.get_width() * scale), int(img.get_height() * scale))
-        scaled_img = pygame.transform.scale(img, scaled_size)
         
-        # Apply transparency
+        # Transparency
         if is_next_stage:
             alpha = int(255 * (transition_progress - 0.3) / 0.7)
         elif transition_progress > 0 and not is_next_stage:
@@ -85,36 +115,77 @@ class UI:
         else:
             alpha = 255
         
-        scaled_img.set_alpha(alpha)
+        self.scene.draw_image(img, (x, y), scaled_size, alpha)
+    
+    def _draw_transition_frame(self, plant, x, y, animation_time, 
+                               water_effect_time, transition_progress):
+        """Draw the nearest pre-rendered crossfade frame"""
+        frame = self.transitions.get_frame(transition_progress)
+        scale = plant.calculate_scale(self.scene_scale, animation_time, water_effect_time)
         
-        # Draw
-        rect = scaled_img.get_rect(center=(x, y))
-        self.screen.blit(scaled_img, rect)
+        scaled_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
+        self.scene.draw_image(frame, (x, y), scaled_size)
     
     def _draw_growth_effects(self, x, y, animation_time):
         """Draw sparkle effects during growth"""
+        radius = 40 * self.scene_scale
+        size = max(1, int(3 * self.scene_scale))
+        
         for i in range(5):
-            sparkle_x = x + 40 * math.cos(animation_time * 3 + i)
-            sparkle_y = y + 40 * math.sin(animation_time * 3 + i)
+            sparkle_x = x + radius * math.cos(animation_time * 3 + i)
+            sparkle_y = y + radius * math.sin(animation_time * 3 + i)
             
             color_intensity = int(128 + 127 * math.sin(animation_time * 5 + i))
             color = (255, color_intensity, 100)
             
-            pygame.draw.circle(self.screen, color, (int(sparkle_x), int(sparkle_y)), 3)
+            self.scene.draw_circle(color, (int(sparkle_x), int(sparkle_y)), size)
+    
+    def setup_hud(self):
+        """Create the cached HUD layers"""
+        self.stats_layer = CachedLayer((20, 20, 300, 120))
+        self.growth_text = None
+        self.history_graph = HistoryGraph(
+            (SCREEN_WIDTH - 320, 20, 300, 60),
+            [("water", COLORS['water_high']), ("happiness", (255, 100, 150))]
+        )
+        self.history_label = None
+        
+        instructions = self.fonts['medium'].render(
+            "W/SPACE: Water 💧  R: Reset 🔄  ESC: Menu", 
+            True, COLORS['text_dark']
+        )
+        # Wide enough for the text even if it overflows the background box
+        layer_width = max(360, 10 + instructions.get_width())
+        self.instructions_layer = CachedLayer(
+            (SCREEN_WIDTH//2 - 180, SCREEN_HEIGHT - 60, layer_width, 40)
+        )
+        self.instructions_layer.update(
+            None, lambda surface: self._render_instructions(surface, instructions)
+        )
     
     def draw_stats_panel(self, plant):
-        """Draw the stats panel with progress bars"""
+        """Draw the stats panel, redrawing it only when the stats change"""
+        current_stage, _, _ = plant.get_current_stage_info()
+        key = (
+            plant.state["water"], plant.state["age"], 
+            plant.state["happiness"], current_stage["name"]
+        )
+        self.stats_layer.update(key, lambda surface: self._render_stats_panel(surface, plant))
+        self.stats_layer.draw(self.canvas)
+    
+    def _render_stats_panel(self, surface, plant):
+        """Render the stats panel with progress bars into its layer"""
         # Background panel
-        panel_rect = pygame.Rect(20, 20, 300, 120)
-        pygame.draw.rect(self.screen, COLORS['panel_bg'], panel_rect)
-        pygame.draw.rect(self.screen, COLORS['panel_border'], panel_rect, 2)
+        panel_rect = surface.get_rect()
+        pygame.draw.rect(surface, COLORS['panel_bg'], panel_rect)
+        pygame.draw.rect(surface, COLORS['panel_border'], panel_rect, 2)
         
-        y_offset = 35
+        y_offset = 15
         
         # Water bar
         self._draw_stat_bar(
-            "💧 Water", plant.state["water"], plant.get_water_color(),
-            30, y_offset, 150
+            surface, "💧 Water", plant.state["water"], plant.get_water_color(),
+            10, y_offset, 150
         )
         y_offset += 30
         
@@ -124,7 +195,7 @@ class UI:
             f"🌱 Age: {plant.state['age']}s ({current_stage['name'].title()})", 
             True, (0, 150, 0)
         )
-        self.screen.blit(age_text, (30, y_offset))
+        surface.blit(age_text, (10, y_offset))
         y_offset += 25
         
         # Happiness indicator
@@ -132,45 +203,73 @@ class UI:
             f"😊 Happiness: {plant.state['happiness']}/100", 
             True, (255, 100, 150)
         )
-        self.screen.blit(happiness_text, (30, y_offset))
+        surface.blit(happiness_text, (10, y_offset))
     
-    def _draw_stat_bar(self, label, value, color, x, y, width):
+    def _draw_stat_bar(self, surface, label, value, color, x, y, width):
         """Draw a progress bar for stats"""
         # Label
         label_text = self.fonts['medium'].render(label, True, (0, 100, 200))
-        self.screen.blit(label_text, (x, y))
+        surface.blit(label_text, (x, y))
         
         # Bar background
         bar_rect = pygame.Rect(x + 90, y + 5, width, 15)
-        pygame.draw.rect(self.screen, (200, 200, 200), bar_rect)
+        pygame.draw.rect(surface, (200, 200, 200), bar_rect)
         
         # Bar fill
         fill_width = int(width * value / 100)
         fill_rect = pygame.Rect(x + 90, y + 5, fill_width, 15)
-        pygame.draw.rect(self.screen, color, fill_rect)
+        pygame.draw.rect(surface, color, fill_rect)
         
         # Bar border
-        pygame.draw.rect(self.screen, COLORS['panel_border'], bar_rect, 1)
+        pygame.draw.rect(surface, COLORS['panel_border'], bar_rect, 1)
     
     def draw_instructions(self):
         """Draw game instructions"""
-        instruction_bg = pygame.Rect(SCREEN_WIDTH//2 - 180, SCREEN_HEIGHT - 60, 360, 40)
-        pygame.draw.rect(self.screen, (255, 255, 255, 180), instruction_bg)
-        pygame.draw.rect(self.screen, COLORS['panel_border'], instruction_bg, 2)
+        self.instructions_layer.draw(self.canvas)
+    
+    def _render_instructions(self, surface, instructions):
+        """Render the instructions box into its layer"""
+        instruction_bg = pygame.Rect(0, 0, 360, 40)
+        pygame.draw.rect(surface, (255, 255, 255, 180), instruction_bg)
+        pygame.draw.rect(surface, COLORS['panel_border'], instruction_bg, 2)
         
-        instructions = self.fonts['medium'].render(
-            "W/SPACE: Water 💧  R: Reset 🔄  ESC: Menu", 
-            True, COLORS['text_dark']
-        )
-        self.screen.blit(instructions, (SCREEN_WIDTH//2 - 170, SCREEN_HEIGHT - 50))
+        surface.blit(instructions, (10, 10))
     
     def draw_growth_indicator(self, plant):
         """Draw growth stage transition indicator"""
         current_stage, next_stage, transition_progress = plant.get_current_stage_info()
         
         if next_stage and transition_progress > 0:
-            growth_text = self.fonts['small'].render(
-                f"Growing into {next_stage['name']}... {int(transition_progress * 100)}%", 
-                True, (0, 150, 0)
+            text = f"Growing into {next_stage['name']}... {int(transition_progress * 100)}%"
+            
+            # Keep the rendered text while it is unchanged
+            if self.growth_text is None or self.growth_text[0] != text:
+                self.growth_text = (
+                    text, self.fonts['small'].render(text, True, (0, 150, 0))
+                )
+            self.canvas.blit(self.growth_text[1], (SCREEN_WIDTH//2 - 100, 150))
+    
+    def cycle_history_window(self):
+        """Step the history graph through raw, per-minute and per-hour samples"""
+        self.history_graph.set_tier((self.history_graph.tier + 1) % (len(HISTORY_TIERS) + 1))
+    
+    def draw_history_graph(self, history):
+        """Draw the water and happiness history graph and its time window"""
+        self.history_graph.draw(self.canvas, history)
+        
+        seconds = self.history_graph.window_seconds(history)
+        if seconds < 3600:
+            window = f"{round(seconds / 60, 1):g} min"
+        elif seconds < 2 * 86400:
+            window = f"{round(seconds / 3600, 1):g} h"
+        else:
+            window = f"{round(seconds / 86400, 1):g} days"
+        
+        # Keep the rendered label while the window is unchanged
+        text = f"History: last {window} (H: zoom)"
+        if self.history_label is None or self.history_label[0] != text:
+            self.history_label = (
+                text, self.fonts['small'].render(text, True, COLORS['text_dark'])
             )
-            self.screen.blit(growth_text, (SCREEN_WIDTH//2 - 100, 150))
\ No newline at end of file
+        rect = self.history_graph.layer.rect
+        self.canvas.blit(self.history_label[1], (rect.left, rect.bottom + 4))
@@ -7,6 +7,7 @@ import pygame
 import json
 import os
 import math
+import statistics
 from .settings import SAVE_FILE, ASSET_PATH, GROWTH_STAGES
 
 
@@ -51,7 +52,15 @@ def load_plant_images():
     for stage in GROWTH_STAGES:
         try:
             img_path = os.path.join(ASSET_PATH, stage["image"])
-            img = pygame.image.load(img_path).convert_alpha()
+            img = pygame.image.load(img_path)
+            if pygame.display.get_surface() is not None:
+                img = img.convert_alpha()
+            else:
+                # The texture backend has no display surface to convert to,
+                # so copy into a per-pixel alpha surface instead
+                loaded = img
+                img = pygame.Surface(loaded.get_size(), pygame.SRCALPHA)
+                img.blit(loaded, (0, 0))
             plant_images[stage["name"]] = img
         except pygame.error:
             # Create placeholder if image doesn't exist
@@ -104,4 +113,25 @@ def ease_out_quad(t):
 
 def lerp(start, end, t):
     """Linear interpolation between two values"""
-    return start + (end - start) * t
\ No newline at end of file
+    return start + (end - start) * t
+
+
+def summarize_timings(samples):
+    """Summarize timings in seconds as count, total and millisecond percentiles"""
+    if not samples:
+        return {}
+    
+    ordered = sorted(samples)
+    
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000
+    
+    return {
+        "count": len(ordered),
+        "total_s": sum(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
\ No newline at end of file
@@ -4,13 +4,35 @@ Virtual Plant Buddy - Main Entry Point
 A beautiful plant growth simulation game with smooth animations
 """
 
+import argparse
 from game import GameManager
+from game.settings import CAPTURE_FORMAT
+from game.capture import CAPTURE_FORMATS
 
 
 def main():
     """Main entry point for the game"""
+    parser = argparse.ArgumentParser(description="Virtual Plant Buddy")
+    parser.add_argument(
+        "--record", metavar="PATH",
+        help="record input and frame timing to PATH for python -m game.replay"
+    )
+    parser.add_argument(
+        "--capture", metavar="DIR",
+        help="capture every frame to DIR without stalling the game loop"
+    )
+    parser.add_argument(
+        "--capture-format", choices=CAPTURE_FORMATS, default=CAPTURE_FORMAT,
+        help="PNG sequence or a raw rgb0 video file (default: %(default)s)"
+    )
+    args = parser.parse_args()
+    
     try:
-        game = GameManager()
+        game = GameManager(
+            record_path=args.record,
+            capture_path=args.capture,
+            capture_format=args.capture_format
+        )
         game.run()
     except KeyboardInterrupt:
         print("\n🌱 Thanks for playing Virtual Plant Buddy!")